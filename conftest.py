@@ -0,0 +1,59 @@
+"""
+Shared Playwright fixtures for the browser QA scripts.
+
+One Chromium instance is launched per test session and every test gets its
+own isolated browser context. The scripts drive the Vite dev server
+(`npm run dev`); they are skipped when it is not reachable. Page helpers
+live in e2e_helpers.py.
+
+The scripts print their findings instead of asserting them, so a plain
+`pytest -s` run shows the output. For a parallel run use `pytest -n auto`
+(pytest-xdist); each worker then owns a single Playwright driver and browser
+process, and the output of passing tests is not shown. Install the
+requirements with `pip install -r requirements-qa.txt && playwright install
+chromium`.
+"""
+
+import urllib.request
+
+import pytest
+from playwright.sync_api import sync_playwright
+
+from e2e_helpers import BASE_URL, LAUNCH_ARGS, VIEWPORT, WAIT_FOR_JS
+
+
+@pytest.fixture(scope="session")
+def playwright():
+    """The Playwright driver for this process, stopped when the session ends"""
+    try:
+        with urllib.request.urlopen(BASE_URL, timeout=2):
+            pass
+    except OSError:
+        pytest.skip(f"web-stroker dev server is not running at {BASE_URL}")
+
+    pw = sync_playwright().start()
+    try:
+        yield pw
+    finally:
+        pw.stop()
+
+
+@pytest.fixture(scope="session")
+def browser(playwright):
+    """A single headless Chromium shared by every test in the session"""
+    browser = playwright.chromium.launch(headless=True, args=LAUNCH_ARGS)
+    try:
+        yield browser
+    finally:
+        browser.close()
+
+
+@pytest.fixture
+def context(browser):
+    """A fresh browser context per test; closed again on teardown"""
+    context = browser.new_context(viewport=VIEWPORT)
+    try:
+        context.add_init_script(WAIT_FOR_JS)
+        yield context
+    finally:
+        context.close()
@@ -0,0 +1,121 @@
+"""
+Page helpers shared by the browser QA scripts.
+
+Navigation, tool selection and canvas input for the web-stroker app. The
+pytest fixtures that provide browsers and contexts live in conftest.py.
+"""
+
+import os
+import re
+
+from playwright.sync_api import expect
+
+BASE_URL = os.environ.get("WEB_STROKER_URL", "http://localhost:5173")
+VIEWPORT = {"width": 1400, "height": 900}
+# Headless canvas checks need neither a GPU process nor background services
+LAUNCH_ARGS = [
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-extensions",
+    "--disable-translate",
+]
+ACTIVE = re.compile(r"\b(active|expanded)\b")
+
+# Resolves with the first element matching a CSS selector, using a
+# MutationObserver instead of polling; rejects after `timeout` ms
+WAIT_FOR_JS = """
+window.__waitFor = (selector, timeout = 2000) => new Promise((resolve, reject) => {
+    const found = document.querySelector(selector);
+    if (found) return resolve(found);
+    const observer = new MutationObserver(() => {
+        const el = document.querySelector(selector);
+        if (el) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(el);
+        }
+    });
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        reject(new Error(`Timed out waiting for ${selector}`));
+    }, timeout);
+    observer.observe(document, { subtree: true, childList: true, attributes: true });
+});
+"""
+
+
+def open_app(page):
+    """Navigate to the app and wait until the canvas can be interacted with"""
+    page.goto(BASE_URL, wait_until="domcontentloaded")
+    page.locator("canvas").first.wait_for(state="visible", timeout=5000)
+
+
+def activate(button):
+    """Click a panel button unless it is already active, then wait for its active state"""
+    if not ACTIVE.search(button.get_attribute("class") or ""):
+        button.click()
+    expect(button).to_have_class(ACTIVE, timeout=2000)
+
+
+def select_tool(page, title):
+    """Click the panel tool button with the given title and wait until it is active"""
+    page.evaluate(
+        """async selector => {
+            const button = await window.__waitFor(selector);
+            if (!button.classList.contains('active')) button.click();
+            await window.__waitFor(selector + '.active');
+        }""",
+        f'button[title="{title}"]',
+    )
+
+
+def draw_line_fast(page, x1, y1, x2, y2, steps=3):
+    """Press, drag and release from (x1, y1) to (x2, y2) in a single evaluate
+
+    DrawingCanvas listens to React's onMouse* handlers, so the events are
+    MouseEvents dispatched on the canvas rather than PointerEvents.
+    """
+    page.evaluate(
+        """([x1, y1, x2, y2, steps]) => {
+            const canvas = document.querySelector('canvas');
+            const fire = (type, x, y, buttons) => canvas.dispatchEvent(
+                new MouseEvent(type, { clientX: x, clientY: y, bubbles: true, button: 0, buttons })
+            );
+            fire('mousedown', x1, y1, 1);
+            for (let i = 1; i <= steps; i++) {
+                fire('mousemove', x1 + (x2 - x1) * i / steps, y1 + (y2 - y1) * i / steps, 1);
+            }
+            fire('mouseup', x2, y2, 0);
+        }""",
+        [x1, y1, x2, y2, steps],
+    )
+    wait_for_paint(page)
+
+
+def click_points_fast(page, points):
+    """Click each (x, y) point on the canvas in order in a single evaluate"""
+    page.evaluate(
+        """points => {
+            const canvas = document.querySelector('canvas');
+            const fire = (type, x, y, buttons) => canvas.dispatchEvent(
+                new MouseEvent(type, { clientX: x, clientY: y, bubbles: true, button: 0, buttons })
+            );
+            for (const [x, y] of points) {
+                fire('mousemove', x, y, 0);
+                fire('mousedown', x, y, 1);
+                fire('mouseup', x, y, 0);
+                fire('click', x, y, 0);
+            }
+        }""",
+        [list(point) for point in points],
+    )
+    wait_for_paint(page)
+
+
+def wait_for_paint(page):
+    """Wait until React has committed and the canvas has repainted"""
+    page.evaluate(
+        "() => new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)))"
+    )
@@ -1,28 +1,39 @@
 #!/usr/bin/env python
 """Simple inspection script to see the actual page structure"""
 
-from playwright.sync_api import sync_playwright
-import time
+import sys
 
-with sync_playwright() as p:
-    browser = p.chromium.launch(headless=True)
-    page = browser.new_page()
-    page.set_viewport_size({"width": 1400, "height": 900})
+import pytest
 
-    page.goto("http://localhost:5173")
-    page.wait_for_load_state("networkidle")
+from e2e_helpers import open_app
+
+# Summarise the page in one round trip instead of serialising the whole DOM
+SUMMARY_JS = """() => ({
+    title: document.title,
+    bodyChildren: [...document.body.children]
+        .slice(0, 10)
+        .map(n => n.outerHTML.slice(0, 200)),
+    buttons: [...document.querySelectorAll('button')]
+        .slice(0, 20)
+        .map(b => ({ text: b.textContent, aria: b.getAttribute('aria-label') })),
+})"""
+
+
+def test_inspect_page(context):
+    page = context.new_page()
+    open_app(page)
+
+    summary = page.evaluate(SUMMARY_JS)
 
     print("=== Page Structure ===")
-    print(page.content()[:2000])
+    print(f"Title: {summary['title']}")
+    for child in summary["bodyChildren"]:
+        print(child)
 
     print("\n=== Buttons on page ===")
-    buttons = page.locator("button").all()
-    for i, btn in enumerate(buttons[:20]):
-        try:
-            text = btn.text_content()
-            aria_label = btn.get_attribute("aria-label")
-            print(f"Button {i}: text='{text}' aria-label='{aria_label}'")
-        except:
-            print(f"Button {i}: (error reading)")
-
-    browser.close()
+    for i, btn in enumerate(summary["buttons"]):
+        print(f"Button {i}: text='{btn['text']}' aria-label='{btn['aria']}'")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-s"]))
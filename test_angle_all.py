@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+"""
+QA tests for the angle measurement tool.
+
+Each scenario runs in its own context on the shared session browser:
+- simple: pick the angle tool, draw two lines and hover on either side
+- qa: intersecting segments, arc follows the mouse, acute label, chaining
+- measurement: draw lines with the Digital line tool, then pick both lines
+"""
+
+import sys
+
+import pytest
+
+from e2e_helpers import (
+    activate,
+    click_points_fast,
+    draw_line_fast,
+    open_app,
+    select_tool,
+    wait_for_paint,
+)
+
+
+def take_screenshot(page, name, clip=None):
+    """Helper to take screenshots for inspection
+
+    With `clip` only that region is captured, otherwise the full page.
+    """
+    path = f"/tmp/angle_test_{name}.png"
+    if clip:
+        page.screenshot(path=path, clip=clip)
+    else:
+        page.screenshot(path=path, full_page=True)
+    print(f"Screenshot saved: {path}")
+
+
+def open_canvas(page):
+    """Open the app and return the canvas center, bounding box and clip region"""
+    open_app(page)
+    page.locator(".drawtool-panel").wait_for(state="visible", timeout=5000)
+
+    box = page.locator("canvas").first.bounding_box()
+    assert box, "Canvas not found"
+    print(f"Canvas found at {box}")
+
+    return {
+        "x": box["x"] + box["width"] / 2,
+        "y": box["y"] + box["height"] / 2,
+        "box": box,
+        "clip": {
+            "x": box["x"],
+            "y": box["y"],
+            "width": box["width"],
+            "height": box["height"],
+        },
+    }
+
+
+def select_angle_tool(page):
+    """Open the Measure section and pick the Angle tool"""
+    activate(page.locator('button:has-text("Measure")').first)
+    select_tool(page, "Angle")
+    print("Angle tool selected")
+
+
+def run_simple(page):
+    canvas_info = open_canvas(page)
+
+    print(f"Found {page.locator('button').count()} buttons")
+
+    select_angle_tool(page)
+
+    print(f"After opening Measure: {page.locator('button').count()} buttons")
+
+    # Take a screenshot
+    wait_for_paint(page)
+    page.screenshot(path="/tmp/after_angle_select.png")
+    print("Screenshot saved")
+
+    # Now try to draw - click on canvas to draw lines
+    cx, cy = canvas_info["x"], canvas_info["y"]
+    print(f"Canvas center: ({cx}, {cy})")
+
+    # Draw first line (vertical)
+    print("Drawing first line...")
+    page.mouse.move(cx - 100, cy - 150)
+    page.mouse.down()
+    page.mouse.move(cx - 100, cy + 150)
+    page.mouse.up()
+    wait_for_paint(page)
+
+    page.screenshot(path="/tmp/first_line.png")
+
+    # Draw second line (horizontal)
+    print("Drawing second line...")
+    page.mouse.move(cx - 200, cy)
+    page.mouse.down()
+    page.mouse.move(cx + 200, cy)
+    page.mouse.up()
+    wait_for_paint(page)
+
+    page.screenshot(path="/tmp/second_line.png")
+
+    # Move mouse around to see arc
+    print("Testing arc movement...")
+    page.mouse.move(cx - 150, cy)
+    wait_for_paint(page)
+    page.screenshot(path="/tmp/arc_left.png")
+
+    page.mouse.move(cx + 150, cy)
+    wait_for_paint(page)
+    page.screenshot(path="/tmp/arc_right.png")
+
+
+def run_qa(page):
+    canvas_info = open_canvas(page)
+    cx, cy = canvas_info["x"], canvas_info["y"]
+    clip = canvas_info["clip"]
+
+    print("\n=== Test 1: Intersecting Segments - Arc follows mouse ===")
+    select_angle_tool(page)
+
+    # Draw two intersecting lines
+    print("Drawing first line (vertical-ish)...")
+    draw_line_fast(page, cx - 100, cy - 150, cx - 100, cy + 150)
+
+    take_screenshot(page, "01_first_line", clip)
+
+    print("Drawing second line (crossing first)...")
+    draw_line_fast(page, cx - 200, cy, cx + 200, cy)
+
+    take_screenshot(page, "02_two_lines", clip)
+
+    # Now test mouse movement triggering arc on different sides
+    print("\nTesting arc appears on mouse side...")
+    print("Moving mouse to LEFT side of intersection...")
+    page.mouse.move(cx - 150, cy)
+    wait_for_paint(page)
+    take_screenshot(page, "03_arc_on_left", clip)
+
+    print("Moving mouse to RIGHT side of intersection...")
+    page.mouse.move(cx + 150, cy)
+    wait_for_paint(page)
+    take_screenshot(page, "04_arc_on_right", clip)
+
+    print("Moving mouse ABOVE intersection...")
+    page.mouse.move(cx - 100, cy - 100)
+    wait_for_paint(page)
+    take_screenshot(page, "05_arc_above", clip)
+
+    print("Moving mouse BELOW intersection...")
+    page.mouse.move(cx - 100, cy + 100)
+    wait_for_paint(page)
+    take_screenshot(page, "06_arc_below", clip)
+
+    print("\n=== Test 2: Arc selection by clicking ===")
+    print("Clicking on left side to select second line...")
+    page.mouse.click(cx - 150, cy)
+    wait_for_paint(page)
+    take_screenshot(page, "07_selected_left", clip)
+
+    # Verify angle value is displayed and is acute
+    print("Checking for angle label...")
+    # An empty list means no label, without waiting for one to appear
+    angle_labels = page.locator("text=/\\d+\\.\\d+°/").all_text_contents()
+    if angle_labels:
+        angle_str = angle_labels[0]
+        print(f"Found angle label: {angle_str}")
+        # Extract angle value
+        angle_val = float(angle_str.replace("°", ""))
+        if angle_val <= 90:
+            print(f"✓ Acute angle: {angle_val}°")
+        else:
+            print(f"✗ NOT acute: {angle_val}° (should be ≤ 90°)")
+    else:
+        print("No angle label found")
+
+    print("\n=== Test 3: Line Chaining ===")
+    print("Drawing third line for chaining test...")
+    draw_line_fast(page, cx, cy - 200, cx, cy + 200)
+    take_screenshot(page, "08_after_third_line")
+
+    print("\nAll tests completed!")
+
+
+def run_measurement(page):
+    canvas_info = open_canvas(page)
+    canvas_x, canvas_y = canvas_info["x"], canvas_info["y"]
+
+    # Draw first line using digital tool
+    # Click on digital tool menu
+    activate(page.locator('button:has-text("digital")').first)
+
+    # Select line tool
+    select_tool(page, "Line")
+
+    # First line: horizontal
+    click_points_fast(
+        page,
+        [
+            (canvas_x - 100, canvas_y),
+            (canvas_x + 100, canvas_y),
+            (canvas_x - 100, canvas_y),  # Close
+        ],
+    )
+
+    # Second line: vertical
+    click_points_fast(
+        page,
+        [
+            (canvas_x, canvas_y - 100),
+            (canvas_x, canvas_y + 100),
+            (canvas_x, canvas_y - 100),  # Close
+        ],
+    )
+
+    print("✓ Lines drawn")
+
+    # Switch to angle measurement tool
+    select_angle_tool(page)
+
+    # Take screenshot before measurement
+    page.screenshot(path="/tmp/before_angle.png", full_page=False)
+
+    # Click on first line
+    page.mouse.click(canvas_x - 50, canvas_y)
+    wait_for_paint(page)
+
+    # Take screenshot after first click
+    page.screenshot(path="/tmp/after_first_click.png", full_page=False)
+
+    # Click on second line
+    page.mouse.click(canvas_x, canvas_y - 50)
+    wait_for_paint(page)
+
+    # Take screenshot after second click
+    page.screenshot(path="/tmp/after_second_click.png", full_page=False)
+
+    print(
+        "✓ Screenshots taken: before_angle, after_first_click, after_second_click"
+    )
+
+    # Check if angle value is displayed in the panel
+    # Look for angle measurement display
+    wait_for_paint(page)
+    content = page.content()
+
+    if "angle:" in content.lower() or "°" in content:
+        print("✓ Angle measurement appears to be displayed")
+    else:
+        print("⚠ Angle measurement text not clearly visible in content")
+
+
+SCENARIOS = {
+    "simple": run_simple,
+    "qa": run_qa,
+    "measurement": run_measurement,
+}
+
+
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+def test_angle(context, scenario):
+    page = context.new_page()
+    SCENARIOS[scenario](page)
+    print(f"Scenario '{scenario}' complete!")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-s"]))